@@ -8,24 +8,48 @@ based on user input for height and weight. It supports both Metric and Imperial
 providing health classification and advice based on the BMI result.
 """
 
+import bisect
 import tkinter as tk
-from tkinter import ttk, messagebox
-from decimal import Decimal, InvalidOperation
+from tkinter import ttk
 
 class BMICalculator:
     """
     Main application class handling BMI calculation and GUI management
     """
 
+    # Accepted (exclusive) input ranges per measurement system
+    _RANGES = {
+        "Metric": {"height": (50, 250), "weight": (20, 500)},
+        "Imperial": {"height": (20, 100), "weight": (45, 1000)}
+    }
+
+    # Conversion factor for BMI from pounds and inches
+    _IMPERIAL_K = 703.0
+
+    # Upper bounds of each classification band, in increasing order.
+    # The tables below are indexed by band: bisect on the bounds gives the index.
+    _BMI_BOUNDS = (18.5, 25, 30)
+    _CATEGORIES = ("Underweight", "Normal Weight", "Overweight", "Obese")
+    _COLORS = ("blue", "green", "orange", "red")
+    _RECOMMENDATIONS = (
+        "Consult a healthcare provider about healthy weight gain strategies.",
+        "Maintain your healthy weight with balanced nutrition and exercise.",
+        "Consider dietary improvements and increased physical activity.",
+        "Consult a healthcare provider for a weight management plan."
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("BMI Calculator Pro")
         self.root.geometry("500x600")
         self.root.resizable(False, False)
 
+        self._results_styles_done = False
         self.setup_styles()
         self.main_frame = ttk.Frame(self.root, padding="20")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
 
         # Initialize variables
         self.unit_system = tk.StringVar(value="Metric")
@@ -33,33 +57,45 @@ class BMICalculator:
         self.weight_unit = tk.StringVar(value="kg")
         self.height_value = tk.StringVar()
         self.weight_value = tk.StringVar()
-        self.bmi_result = tk.DoubleVar()
-        self.bmi_category = tk.StringVar()
+        self._last_band_idx = None
+
+        # Both screens are built once in the same cell; only one is gridded at a time
+        self.input_frame = ttk.Frame(self.main_frame)
+        self.input_frame.grid(row=0, column=0, sticky='nsew')
+        self.results_frame = ttk.Frame(self.main_frame)
+        self.results_frame.grid(row=0, column=0, sticky='nsew')
 
+        self.build_input_frame()
+        self.build_results_frame()
         self.create_main_window()
 
     def setup_styles(self):
-        """Configure widget styles"""
-        style = ttk.Style()
-        style.configure('TLabel', font=('Arial', 12))
-        style.configure('Header.TLabel', font=('Arial', 16, 'bold'))
-        style.configure('Result.TLabel', font=('Arial', 14))
-        style.configure('TButton', font=('Arial', 12))
-        style.configure('Calculate.TButton', font=('Arial', 12, 'bold'))
-
-    def create_main_window(self):
+        """Configure the shared base font and first-screen style overrides"""
+        self.style = ttk.Style()
+        self.style.configure('.', font=('Arial', 12))
+        self.style.configure('Header.TLabel', font=('Arial', 16, 'bold'))
+        self.style.configure('Calculate.TButton', font=('Arial', 12, 'bold'))
+        self.style.configure('Emoji.TLabel', font=('Arial', 24))
+
+    def setup_results_styles(self):
+        """Configure styles only used by the results interface"""
+        self.style.configure('Result.TLabel', font=('Arial', 14))
+        self.style.configure('BigBold.TLabel', font=('Arial', 16, 'bold'))
+        self._results_styles_done = True
+
+    def build_input_frame(self):
         """Build the main input interface"""
-        self.clear_frame()
+        frame = self.input_frame
 
         # Title and description
-        ttk.Label(self.main_frame, text="BMI Calculator Pro", style='Header.TLabel'
+        ttk.Label(frame, text="BMI Calculator Pro", style='Header.TLabel'
                   ).grid(row=0, column=0, columnspan=3, pady=10, sticky='w')
-        ttk.Label(self.main_frame,
+        ttk.Label(frame,
                   text="Calculate your Body Mass Index (BMI) to assess your weight relative to your height.",
                   wraplength=450).grid(row=1, column=0, columnspan=3, pady=10, sticky='w')
 
         # Unit system selection
-        unit_frame = ttk.LabelFrame(self.main_frame, text="Measurement System")
+        unit_frame = ttk.LabelFrame(frame, text="Measurement System")
         unit_frame.grid(row=2, column=0, columnspan=3, pady=10, sticky='ew')
 
         ttk.Radiobutton(unit_frame, text="Metric (kg, cm)", variable=self.unit_system,
@@ -70,21 +106,21 @@ class BMICalculator:
                         ).grid(row=0, column=1, padx=20, pady=5, sticky='w')
 
         # Height input
-        ttk.Label(self.main_frame, text="Height:").grid(row=3, column=0, pady=10, sticky='w')
-        ttk.Entry(self.main_frame, textvariable=self.height_value, width=10
+        ttk.Label(frame, text="Height:").grid(row=3, column=0, pady=10, sticky='w')
+        ttk.Entry(frame, textvariable=self.height_value, width=10
                   ).grid(row=3, column=1, pady=10, sticky='w')
-        ttk.Label(self.main_frame, textvariable=self.height_unit
+        ttk.Label(frame, textvariable=self.height_unit
                   ).grid(row=3, column=2, pady=10, sticky='w')
 
         # Weight input
-        ttk.Label(self.main_frame, text="Weight:").grid(row=4, column=0, pady=10, sticky='w')
-        ttk.Entry(self.main_frame, textvariable=self.weight_value, width=10
+        ttk.Label(frame, text="Weight:").grid(row=4, column=0, pady=10, sticky='w')
+        ttk.Entry(frame, textvariable=self.weight_value, width=10
                   ).grid(row=4, column=1, pady=10, sticky='w')
-        ttk.Label(self.main_frame, textvariable=self.weight_unit
+        ttk.Label(frame, textvariable=self.weight_unit
                   ).grid(row=4, column=2, pady=10, sticky='w')
 
         # Buttons
-        button_frame = ttk.Frame(self.main_frame)
+        button_frame = ttk.Frame(frame)
         button_frame.grid(row=5, column=0, columnspan=3, pady=20)
 
         ttk.Button(button_frame, text="Calculate BMI", command=self.calculate_bmi,
@@ -95,97 +131,113 @@ class BMICalculator:
                     ).grid(row=0, column=2, padx=10)
 
         # Health emojis
-        emoji_label = ttk.Label(self.main_frame, 
+        emoji_label = ttk.Label(frame, 
                               text="🏋♂💪🍎🏃♀", 
-                              font=('Arial', 24))
+                              style='Emoji.TLabel')
         emoji_label.grid(row=6, column=0, columnspan=3, pady=20)
 
-    def create_results_window(self):
+    def build_results_frame(self):
         """Build the results display interface"""
-        self.clear_frame()
+        frame = self.results_frame
 
         # Results header
-        ttk.Label(self.main_frame, text="Your BMI Results", style='Header.TLabel'
+        ttk.Label(frame, text="Your BMI Results", style='Header.TLabel'
                   ).grid(row=0, column=0, columnspan=2, pady=10, sticky='w')
 
         # BMI value
-        ttk.Label(self.main_frame, text="Your BMI:", style='Result.TLabel'
+        ttk.Label(frame, text="Your BMI:", style='Result.TLabel'
                   ).grid(row=1, column=0, pady=10, sticky='w')
-        ttk.Label(self.main_frame, textvariable=self.bmi_result,
-                  style='Result.TLabel', font=('Arial', 16, 'bold')
-                  ).grid(row=1, column=1, pady=10, sticky='w')
+        self.bmi_value_label = ttk.Label(frame, style='BigBold.TLabel')
+        self.bmi_value_label.grid(row=1, column=1, pady=10, sticky='w')
 
         # BMI category
-        ttk.Label(self.main_frame, text="Classification:", style='Result.TLabel'
+        ttk.Label(frame, text="Classification:", style='Result.TLabel'
                   ).grid(row=2, column=0, pady=10, sticky='w')
-        self.category_value_label = ttk.Label(self.main_frame, textvariable=self.bmi_category,
-                                                 style='Result.TLabel', font=('Arial', 16, 'bold'))
+        self.category_value_label = ttk.Label(frame, style='BigBold.TLabel')
         self.category_value_label.grid(row=2, column=1, pady=10, sticky='w')
-        self.set_category_color()
 
         # Recommendation
-        recommendation_frame = ttk.LabelFrame(self.main_frame, text="Health Recommendation")
+        recommendation_frame = ttk.LabelFrame(frame, text="Health Recommendation")
         recommendation_frame.grid(row=3, column=0, columnspan=2, pady=20, sticky='ew')
-        ttk.Label(recommendation_frame, text=self.get_recommendation(), wraplength=450
-                  ).grid(row=0, column=0, padx=10, pady=10)
+        self.recommendation_label = ttk.Label(recommendation_frame, wraplength=450)
+        self.recommendation_label.grid(row=0, column=0, padx=10, pady=10)
 
         # BMI chart emojis
-        chart_emojis = ttk.Label(self.main_frame, 
+        chart_emojis = ttk.Label(frame, 
                                text="📊🏃♀🏋♂🍏⚖️❤️", 
-                               font=('Arial', 24))
+                               style='Emoji.TLabel')
         chart_emojis.grid(row=4, column=0, columnspan=2, pady=10)
 
         # Navigation buttons
-        button_frame = ttk.Frame(self.main_frame)
+        button_frame = ttk.Frame(frame)
         button_frame.grid(row=5, column=0, columnspan=2, pady=20)
         ttk.Button(button_frame, text="Back to Calculator", command=self.create_main_window
                   ).grid(row=0, column=0, padx=10)
         ttk.Button(button_frame, text="Exit", command=self.exit_application
                                      ).grid(row=0, column=1, padx=10)
 
+    def create_main_window(self):
+        """Show the main input interface"""
+        self.results_frame.grid_remove()
+        self.input_frame.grid()
+        self.input_frame.focus_set()
+
+    def create_results_window(self):
+        """Show the results display interface"""
+        if not self._results_styles_done:
+            self.setup_results_styles()
+        self.input_frame.grid_remove()
+        self.results_frame.grid()
+        self.results_frame.focus_set()
+
     # ... (Keep all other methods unchanged below this point)
 
     def update_unit_labels(self):
         """Update measurement units based on selected system"""
-        system = self.unit_system.get()
-        self.height_unit.set("cm" if system == "Metric" else "in")
-        self.weight_unit.set("kg" if system == "Metric" else "lb")
+        metric = self.unit_system.get() == "Metric"
+        self.height_unit.set("cm" if metric else "in")
+        self.weight_unit.set("kg" if metric else "lb")
 
     def validate_input(self):
         """Validate user input values"""
-        if not self.height_value.get() or not self.weight_value.get():
+        from tkinter import messagebox
+
+        h_str = self.height_value.get()
+        w_str = self.weight_value.get()
+        system = self.unit_system.get()
+
+        if not h_str or not w_str:
             messagebox.showerror("Input Error", "Please enter both height and weight values.")
             return False
 
         try:
-            height = Decimal(self.height_value.get())
-            weight = Decimal(self.weight_value.get())
+            height = float(h_str)
+            weight = float(w_str)
 
             if height <= 0 or weight <= 0:
                 messagebox.showerror("Input Error", "Values must be positive numbers.")
                 return False
 
-            system = self.unit_system.get()
-            ranges = {
-                "Metric": {"height": (50, 250), "weight": (20, 500)},
-                "Imperial": {"height": (20, 100), "weight": (45, 1000)}
-            }
+            ranges = self._RANGES[system]
+            h_min, h_max = ranges["height"]
+            w_min, w_max = ranges["weight"]
 
-            if not (ranges[system]["height"][0] < height < ranges[system]["height"][1]):
+            if not (h_min < height < h_max):
                 messagebox.showerror("Input Error",
-                                        f"Height must be between {ranges[system]['height'][0]} "
-                                        f"and {ranges[system]['height'][1]} {self.height_unit.get()}")
+                                        f"Height must be between {h_min} "
+                                        f"and {h_max} {self.height_unit.get()}")
                 return False
 
-            if not (ranges[system]["weight"][0] < weight < ranges[system]["weight"][1]):
+            if not (w_min < weight < w_max):
                 messagebox.showerror("Input Error",
-                                        f"Weight must be between {ranges[system]['weight'][0]} "
-                                        f"and {ranges[system]['weight'][1]} {self.weight_unit.get()}")
+                                        f"Weight must be between {w_min} "
+                                        f"and {w_max} {self.weight_unit.get()}")
                 return False
 
+            self._height, self._weight, self._system = height, weight, system
             return True
 
-        except InvalidOperation:
+        except ValueError:
             messagebox.showerror("Input Error", "Please enter valid numbers.")
             return False
 
@@ -195,53 +247,35 @@ class BMICalculator:
             return
 
         try:
-            height = float(self.height_value.get())
-            weight = float(self.weight_value.get())
+            height, weight = self._height, self._weight
 
-            if self.unit_system.get() == "Metric":
-                bmi = weight / ((height / 100) ** 2)
+            if self._system == "Metric":
+                h = height * 0.01
+                bmi = weight / (h * h)
             else:
-                bmi = 703 * weight / (height ** 2)
-
-            self.bmi_result.set(round(bmi, 1))
-            self.bmi_category.set(self.classify_bmi(bmi))
+                bmi = self._IMPERIAL_K * weight / (height * height)
+
+            idx = bisect.bisect_right(self._BMI_BOUNDS, bmi)
+            self.bmi_value_label.configure(text=f"{bmi:.1f}")
+            # Band-dependent labels only need updating when the band changes
+            if idx != self._last_band_idx:
+                self.set_category_color(idx)
+                self.recommendation_label.configure(text=self.get_recommendation(idx))
+                self._last_band_idx = idx
             self.create_results_window()
 
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Calculation Error", f"Error: {str(e)}")
 
-    def classify_bmi(self, bmi):
-        """Determine BMI classification"""
-        if bmi < 18.5: return "Underweight"
-        if bmi < 25: return "Normal Weight"
-        if bmi < 30: return "Overweight"
-        return "Obese"
-
-    def set_category_color(self):
-        """Set color coding for BMI classification"""
-        colors = {
-            "Underweight": "blue",
-            "Normal Weight": "green",
-            "Overweight": "orange",
-            "Obese": "red"
-        }
+    def set_category_color(self, idx):
+        """Show the BMI classification for band idx with its color coding"""
         self.category_value_label.configure(
-            foreground=colors.get(self.bmi_category.get(), "black"))
-
-    def get_recommendation(self):
-        """Generate health recommendation based on BMI"""
-        recommendations = {
-            "Underweight": "Consult a healthcare provider about healthy weight gain strategies.",
-            "Normal Weight": "Maintain your healthy weight with balanced nutrition and exercise.",
-            "Overweight": "Consider dietary improvements and increased physical activity.",
-            "Obese": "Consult a healthcare provider for a weight management plan."
-        }
-        return recommendations.get(self.bmi_category.get(), "")
-
-    def clear_frame(self):
-        """Clear all widgets from the main frame"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+            text=self._CATEGORIES[idx], foreground=self._COLORS[idx])
+
+    def get_recommendation(self, idx):
+        """Generate health recommendation for BMI band idx"""
+        return self._RECOMMENDATIONS[idx]
 
     def clear_inputs(self):
         """Reset input fields"""
@@ -250,6 +284,8 @@ class BMICalculator:
 
     def exit_application(self):
         """Handle application exit"""
+        from tkinter import messagebox
+
         if messagebox.askyesno("Exit", "Are you sure you want to quit?"):
             self.root.destroy()
 